@@ -16,9 +16,78 @@ This module provides a basic educational framework for working with Monster grou
 """
 
 import math
-from typing import Optional, List, Dict, Any
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Optional, Any, ClassVar, Mapping, Sequence, Tuple
 
 
+# Prime factorization of the Monster group order (read-only, shared by all callers)
+_FACTORIZATION: Mapping[int, int] = MappingProxyType({
+    2: 46,
+    3: 20,
+    5: 9,
+    7: 6,
+    11: 2,
+    13: 3,
+    17: 1,
+    19: 1,
+    23: 1,
+    29: 1,
+    31: 1,
+    41: 1,
+    47: 1,
+    59: 1,
+    71: 1
+})
+
+
+def _balanced_prod(values: Sequence[int]) -> int:
+    """
+    Multiply integers as a balanced product tree.
+    
+    Keeping operand sizes similar avoids the ever-growing accumulator of a
+    left fold, which matters for large integers.
+    """
+    if len(values) <= 2:
+        return math.prod(values)
+    mid = len(values) // 2
+    return _balanced_prod(values[:mid]) * _balanced_prod(values[mid:])
+
+
+# Order recomputed from the factorization once at import time
+_COMPUTED_ORDER = _balanced_prod([prime ** power for prime, power in _FACTORIZATION.items()])
+
+# (prime, power, prime^power, percentage of the order) for each prime factor
+_PRIME_CONTRIBUTIONS: Tuple[Tuple[int, int, int, float], ...] = tuple(
+    (prime, power, prime ** power, (prime ** power / _COMPUTED_ORDER) * 100)
+    for prime, power in sorted(_FACTORIZATION.items())
+)
+
+# Some notable maximal subgroups of the Monster
+_MAXIMAL_SUBGROUPS: Tuple[str, ...] = (
+    "2^1+24.Co1 (Baby Monster normalizer)",
+    "2^2+11+22.(M24 × S3)",
+    "3^1+12.2.Suz.2",
+    "2^5+10+20.(S3 × L5(2))",
+    "5^1+6.2.J2.4",
+    "7^1+4.(3 × 2S7)",
+    "11^1+2.(5 × 2S5)",
+    "13^1+2.(3 × 4S4)",
+    "(D10 × HN).2",
+    "2^10+16.O10^+(2)"
+)
+
+# Basic character table information (read-only)
+_CHAR_TABLE_INFO: Mapping[str, Any] = MappingProxyType({
+    "irreducible_representations": 194,
+    "smallest_faithful_representation": 196883,
+    "moonshine_connection": True,
+    "j_invariant_coefficients": (196884, 21493760, 864299970, ...)
+})
+
+
+@dataclass(frozen=True, slots=True)
 class MonsterGroup:
     """
     Represents the Monster group (M), the largest sporadic simple group.
@@ -26,32 +95,37 @@ class MonsterGroup:
     The Monster group has order:
     808,017,424,794,512,875,886,459,904,961,710,757,005,754,368,000,000,000
     ≈ 8.08 × 10^53
+    
+    Instances are immutable and hashable, so they can be used as cache keys.
+    There is a single shared instance; name and symbol are fixed.
     """
     
+    name: str = field(init=False, default="Monster")
+    symbol: str = field(init=False, default="M")
+    
     # Monster group order (exact value)
-    ORDER = 808017424794512875886459904961710757005754368000000000
+    ORDER: ClassVar[int] = 808017424794512875886459904961710757005754368000000000
     
-    def __init__(self):
-        """Initialize Monster group instance."""
-        self._generators = None
-        self._name = "Monster"
-        self._symbol = "M"
+    # Precomputed decimal forms of ORDER for display paths
+    ORDER_STR: ClassVar[str] = "808017424794512875886459904961710757005754368000000000"
+    ORDER_COMMAS: ClassVar[str] = "808,017,424,794,512,875,886,459,904,961,710,757,005,754,368,000,000,000"
+    
+    # Cached default instance; the group holds only constants, so one object suffices
+    _instance: ClassVar[Optional["MonsterGroup"]] = None
+    
+    def __new__(cls):
+        """Return the shared Monster group instance, creating it on first use."""
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = object.__new__(cls)
+            cls._instance = instance
+        return instance
     
     @property
     def order(self) -> int:
         """Return the order of the Monster group."""
         return self.ORDER
     
-    @property
-    def name(self) -> str:
-        """Return the name of the group."""
-        return self._name
-    
-    @property
-    def symbol(self) -> str:
-        """Return the mathematical symbol for the group."""
-        return self._symbol
-    
     def is_sporadic(self) -> bool:
         """Return True since Monster is a sporadic group."""
         return True
@@ -60,77 +134,41 @@ class MonsterGroup:
         """Return True since Monster is a simple group."""
         return True
     
-    def get_factorization(self) -> Dict[int, int]:
+    def get_factorization(self) -> Mapping[int, int]:
         """
         Return the prime factorization of the Monster group order.
         
         M = 2^46 × 3^20 × 5^9 × 7^6 × 11^2 × 13^3 × 17 × 19 × 23 × 29 × 31 × 41 × 47 × 59 × 71
+        
+        The returned mapping is read-only and shared; use dict(...) for a mutable copy.
         """
-        return {
-            2: 46,
-            3: 20,
-            5: 9,
-            7: 6,
-            11: 2,
-            13: 3,
-            17: 1,
-            19: 1,
-            23: 1,
-            29: 1,
-            31: 1,
-            41: 1,
-            47: 1,
-            59: 1,
-            71: 1
-        }
+        return _FACTORIZATION
     
     def verify_order(self) -> bool:
         """Verify that the stored order matches the prime factorization."""
-        factorization = self.get_factorization()
-        calculated_order = 1
-        
-        for prime, power in factorization.items():
-            calculated_order *= prime ** power
-        
-        return calculated_order == self.ORDER
+        return _COMPUTED_ORDER == self.ORDER
     
-    def get_maximal_subgroups_info(self) -> List[str]:
+    def get_maximal_subgroups_info(self) -> Tuple[str, ...]:
         """
         Return information about some notable maximal subgroups.
         """
-        return [
-            "2^1+24.Co1 (Baby Monster normalizer)",
-            "2^2+11+22.(M24 × S3)",
-            "3^1+12.2.Suz.2",
-            "2^5+10+20.(S3 × L5(2))",
-            "5^1+6.2.J2.4",
-            "7^1+4.(3 × 2S7)",
-            "11^1+2.(5 × 2S5)",
-            "13^1+2.(3 × 4S4)",
-            "(D10 × HN).2",
-            "2^10+16.O10^+(2)"
-        ]
+        return _MAXIMAL_SUBGROUPS
     
     def get_conjugacy_classes_count(self) -> int:
         """Return the number of conjugacy classes in the Monster group."""
         return 194
     
-    def get_character_table_info(self) -> Dict[str, Any]:
-        """Return basic information about the character table."""
-        return {
-            "irreducible_representations": 194,
-            "smallest_faithful_representation": 196883,
-            "moonshine_connection": True,
-            "j_invariant_coefficients": [196884, 21493760, 864299970, ...]
-        }
+    def get_character_table_info(self) -> Mapping[str, Any]:
+        """Return basic information about the character table (read-only)."""
+        return _CHAR_TABLE_INFO
     
     def __str__(self) -> str:
         """String representation of the Monster group."""
-        return f"Monster Group (M) - Order: {self.ORDER}"
+        return f"Monster Group (M) - Order: {self.ORDER_STR}"
     
     def __repr__(self) -> str:
         """Formal string representation of the Monster group."""
-        return f"MonsterGroup(order={self.ORDER})"
+        return f"MonsterGroup(order={self.ORDER_STR})"
 
 
 class MonsterElement:
@@ -146,6 +184,11 @@ class MonsterElement:
     and substantial computational resources available in professional implementations.
     """
     
+    __slots__ = ("element_id",)
+    
+    # Shared group instance; MonsterGroup only holds constants
+    _GROUP = MonsterGroup()
+    
     def __init__(self, element_id: Optional[str] = None):
         """
         Initialize a Monster group element.
@@ -153,8 +196,17 @@ class MonsterElement:
         Args:
             element_id: Optional identifier for the element
         """
-        self.element_id = element_id or "e"  # Default to identity
-        self.group = MonsterGroup()
+        element_id = element_id or "e"  # Default to identity
+        # Intern plain string ids so equal ids share one object; str equality
+        # checks identity first. Other id types are stored unchanged.
+        if type(element_id) is str:
+            element_id = sys.intern(element_id)
+        self.element_id = element_id
+    
+    @property
+    def group(self) -> MonsterGroup:
+        """Return the Monster group this element belongs to."""
+        return MonsterElement._GROUP
     
     @property
     def is_identity(self) -> bool:
@@ -191,40 +243,44 @@ class MonsterElement:
 
 def demonstrate_monster_group():
     """Demonstrate basic Monster group functionality."""
-    print("Monster Group Demonstration")
-    print("=" * 30)
+    # Build the output and write it in one call rather than one print per line
+    lines = []
+    lines.append("Monster Group Demonstration")
+    lines.append("=" * 30)
     
     # Create Monster group instance
     monster = MonsterGroup()
     
-    print(f"Group: {monster}")
-    print(f"Order: {monster.order:,}")
-    print(f"Is sporadic: {monster.is_sporadic()}")
-    print(f"Is simple: {monster.is_simple()}")
-    print(f"Conjugacy classes: {monster.get_conjugacy_classes_count()}")
+    lines.append(f"Group: {monster}")
+    lines.append(f"Order: {monster.ORDER_COMMAS}")
+    lines.append(f"Is sporadic: {monster.is_sporadic()}")
+    lines.append(f"Is simple: {monster.is_simple()}")
+    lines.append(f"Conjugacy classes: {monster.get_conjugacy_classes_count()}")
     
-    print(f"\nOrder verification: {monster.verify_order()}")
+    lines.append(f"\nOrder verification: {monster.verify_order()}")
     
-    print("\nPrime factorization:")
+    lines.append("\nPrime factorization:")
     for prime, power in monster.get_factorization().items():
-        print(f"  {prime}^{power}")
+        lines.append(f"  {prime}^{power}")
     
-    print("\nSome maximal subgroups:")
+    lines.append("\nSome maximal subgroups:")
     for subgroup in monster.get_maximal_subgroups_info()[:5]:
-        print(f"  {subgroup}")
+        lines.append(f"  {subgroup}")
     
-    print("\nCharacter table info:")
+    lines.append("\nCharacter table info:")
     char_info = monster.get_character_table_info()
-    print(f"  Irreducible representations: {char_info['irreducible_representations']}")
-    print(f"  Smallest faithful representation: {char_info['smallest_faithful_representation']}")
-    print(f"  Moonshine connection: {char_info['moonshine_connection']}")
+    lines.append(f"  Irreducible representations: {char_info['irreducible_representations']}")
+    lines.append(f"  Smallest faithful representation: {char_info['smallest_faithful_representation']}")
+    lines.append(f"  Moonshine connection: {char_info['moonshine_connection']}")
     
     # Demonstrate elements
-    print("\nMonster group elements:")
+    lines.append("\nMonster group elements:")
     identity = MonsterElement("e")
-    print(f"  Identity: {identity}")
-    print(f"  Identity order: {identity.order()}")
-    print(f"  Identity conjugacy class: {identity.conjugacy_class()}")
+    lines.append(f"  Identity: {identity}")
+    lines.append(f"  Identity order: {identity.order()}")
+    lines.append(f"  Identity conjugacy class: {identity.conjugacy_class()}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -2,11 +2,36 @@
 Utilities for working with the Monster group.
 """
 
-from typing import List, Tuple
+from typing import List, Mapping, Tuple
+import functools
 import math
-from monster_group import MonsterGroup
+import sys
+from operator import itemgetter
+from types import MappingProxyType
 
 
+# Monstrous moonshine summary (read-only, shared by all callers)
+_MOONSHINE_INFO: Mapping[str, str] = MappingProxyType({
+    "description": "Monstrous moonshine is a connection between the Monster group and modular functions",
+    "j_invariant_expansion": "j(τ) = q^(-1) + 744 + 196884q + 21493760q^2 + ...",
+    "significance": "The coefficient 196884 = 196883 + 1, where 196883 is the dimension of the smallest faithful representation of M",
+    "generalized_moonshine": "Extends to other sporadic groups",
+    "fields_medalist": "Richard Borcherds proved the moonshine conjectures in 1992, winning the Fields Medal in 1998"
+})
+
+
+def _monster_group():
+    """
+    Import the monster_group module on first use.
+    
+    Deferring the import keeps monster_utils cheap to load when only the
+    formatting or moonshine helpers are needed.
+    """
+    import monster_group
+    return monster_group
+
+
+@functools.lru_cache(maxsize=128)
 def format_large_number(n: int) -> str:
     """
     Format a large number with scientific notation and commas.
@@ -19,11 +44,13 @@ def format_large_number(n: int) -> str:
     """
     # Regular formatting with commas
     formatted = f"{n:,}"
+    digits = formatted.replace(",", "")
     
-    # Scientific notation
+    # Scientific notation, read off the leading decimal digits rather than
+    # dividing the full bignum (17 digits is all a float can hold)
     if n > 0:
-        exponent = int(math.log10(n))
-        mantissa = n / (10 ** exponent)
+        exponent = len(digits) - 1
+        mantissa = int(digits[:17]) / (10 ** min(exponent, 16))
         scientific = f"{mantissa:.2f} × 10^{exponent}"
     else:
         scientific = "0"
@@ -31,14 +58,36 @@ def format_large_number(n: int) -> str:
     return f"{formatted} (≈ {scientific})"
 
 
-def compare_group_orders() -> List[Tuple[str, int, str]]:
+def _approx_ratio(a: int, b: int) -> float:
     """
-    Compare the Monster group order with other notable groups.
+    Approximate a / b for positive integers without a full bignum division.
+    
+    Both operands are truncated to their leading 64 bits and the difference
+    in dropped bits is restored with ldexp, which is ample for display.
     
+    Args:
+        a: The numerator
+        b: The denominator
+        
     Returns:
-        List of tuples (group_name, order, description)
+        The approximate ratio as a float
+    """
+    shift_a = max(0, a.bit_length() - 64)
+    shift_b = max(0, b.bit_length() - 64)
+    return math.ldexp((a >> shift_a) / (b >> shift_b), shift_a - shift_b)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_comparisons() -> Tuple[Tuple[str, int, str], ...]:
+    """
+    Build the group order comparison table.
+    
+    The inputs are fixed, so the table is built once on first use and cached.
+    
+    Returns:
+        Tuple of tuples (group_name, order, description)
     """
-    monster_order = MonsterGroup.ORDER
+    monster_order = _monster_group().MonsterGroup.ORDER
     
     groups = [
         ("Symmetric S_n groups", {
@@ -58,7 +107,7 @@ def compare_group_orders() -> List[Tuple[str, int, str]]:
     
     for category, group_dict in groups:
         for name, order in group_dict.items():
-            ratio = monster_order / order if order != monster_order else 1
+            ratio = _approx_ratio(monster_order, order) if order != monster_order else 1
             if ratio > 1:
                 desc = f"Monster is {ratio:.2e} times larger"
             elif ratio == 1:
@@ -68,85 +117,92 @@ def compare_group_orders() -> List[Tuple[str, int, str]]:
             
             comparisons.append((name, order, desc))
     
-    return comparisons
+    return tuple(comparisons)
 
 
-def get_moonshine_info() -> dict:
+def compare_group_orders() -> List[Tuple[str, int, str]]:
+    """
+    Compare the Monster group order with other notable groups.
+    
+    Returns:
+        List of tuples (group_name, order, description)
+    """
+    return list(_build_comparisons())
+
+
+def get_moonshine_info() -> Mapping[str, str]:
     """
     Get information about monstrous moonshine.
     
     Returns:
-        Dictionary with moonshine-related information
+        Read-only mapping with moonshine-related information
     """
-    return {
-        "description": "Monstrous moonshine is a connection between the Monster group and modular functions",
-        "j_invariant_expansion": "j(τ) = q^(-1) + 744 + 196884q + 21493760q^2 + ...",
-        "significance": "The coefficient 196884 = 196883 + 1, where 196883 is the dimension of the smallest faithful representation of M",
-        "generalized_moonshine": "Extends to other sporadic groups",
-        "fields_medalist": "Richard Borcherds proved the moonshine conjectures in 1992, winning the Fields Medal in 1998"
-    }
+    return _MOONSHINE_INFO
 
 
 def analyze_factorization():
     """
     Analyze the prime factorization of the Monster group order.
     """
-    monster = MonsterGroup()
+    group_module = _monster_group()
+    monster = group_module.MonsterGroup()
     factorization = monster.get_factorization()
     
-    print("Monster Group Prime Factorization Analysis")
-    print("=" * 45)
+    # Build the report and write it in one call rather than one print per line
+    lines = []
+    lines.append("Monster Group Prime Factorization Analysis")
+    lines.append("=" * 45)
     
-    print(f"\nTotal order: {format_large_number(monster.order)}")
+    lines.append(f"\nTotal order: {format_large_number(monster.order)}")
     
-    print(f"\nPrime factorization: M = ", end="")
     factors = []
     for prime, power in sorted(factorization.items()):
         if power == 1:
             factors.append(f"{prime}")
         else:
             factors.append(f"{prime}^{power}")
-    print(" × ".join(factors))
+    lines.append("\nPrime factorization: M = " + " × ".join(factors))
     
-    print(f"\nNumber of distinct prime factors: {len(factorization)}")
-    print(f"Largest prime factor: {max(factorization.keys())}")
-    print(f"Highest power: {max(factorization.values())} (for prime {[p for p, pow in factorization.items() if pow == max(factorization.values())][0]})")
+    lines.append(f"\nNumber of distinct prime factors: {len(factorization)}")
+    lines.append(f"Largest prime factor: {max(factorization.keys())}")
+    max_prime, max_power = max(factorization.items(), key=itemgetter(1))
+    lines.append(f"Highest power: {max_power} (for prime {max_prime})")
     
     # Calculate contribution of each prime
-    print("\nContribution of each prime to the total order:")
-    total_order = monster.order
-    for prime in sorted(factorization.keys()):
-        power = factorization[prime]
-        contribution = prime ** power
-        percentage = (contribution / total_order) * 100
-        print(f"  {prime}^{power} contributes {contribution:,} ({percentage:.10f}%)")
+    lines.append("\nContribution of each prime to the total order:")
+    for prime, power, contribution, percentage in group_module._PRIME_CONTRIBUTIONS:
+        lines.append(f"  {prime}^{power} contributes {contribution:,} ({percentage:.10f}%)")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demonstrate_utilities():
     """Demonstrate the utility functions."""
-    print("Monster Group Utilities Demonstration")
-    print("=" * 40)
+    lines = []
+    lines.append("Monster Group Utilities Demonstration")
+    lines.append("=" * 40)
     
     # Large number formatting
-    monster = MonsterGroup()
-    print(f"\nMonster group order: {format_large_number(monster.order)}")
+    monster = _monster_group().MonsterGroup()
+    lines.append(f"\nMonster group order: {format_large_number(monster.order)}")
     
     # Group comparisons
-    print("\nGroup Order Comparisons:")
+    lines.append("\nGroup Order Comparisons:")
     comparisons = compare_group_orders()
     for name, order, desc in comparisons[:8]:  # Show first 8
-        print(f"  {name}: {order:,}")
-        print(f"    {desc}")
+        lines.append(f"  {name}: {order:,}")
+        lines.append(f"    {desc}")
     
     # Moonshine information
-    print("\nMonstrous Moonshine:")
+    lines.append("\nMonstrous Moonshine:")
     moonshine = get_moonshine_info()
-    print(f"  {moonshine['description']}")
-    print(f"  J-invariant: {moonshine['j_invariant_expansion']}")
-    print(f"  Significance: {moonshine['significance']}")
+    lines.append(f"  {moonshine['description']}")
+    lines.append(f"  J-invariant: {moonshine['j_invariant_expansion']}")
+    lines.append(f"  Significance: {moonshine['significance']}")
     
     # Factorization analysis
-    print("\n")
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines) + "\n")
     analyze_factorization()
 
 
@@ -2,6 +2,8 @@
 Tests for Monster Group implementation.
 """
 
+import copy
+import pickle
 import unittest
 import sys
 import os
@@ -10,6 +12,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from monster_group import MonsterGroup, MonsterElement
+from monster_utils import format_large_number, compare_group_orders, get_moonshine_info
 
 
 class TestMonsterGroup(unittest.TestCase):
@@ -27,15 +30,51 @@ class TestMonsterGroup(unittest.TestCase):
         self.assertTrue(self.monster.is_simple())
         self.assertEqual(self.monster.get_conjugacy_classes_count(), 194)
     
+    def test_singleton(self):
+        """Test that MonsterGroup() always returns the same instance."""
+        self.assertIs(MonsterGroup(), self.monster)
+    
+    def test_frozen_and_hashable(self):
+        """Test that the group is immutable and usable as a dict key."""
+        with self.assertRaises(AttributeError):
+            self.monster.name = "Baby Monster"
+        self.assertEqual({self.monster: 1}[MonsterGroup()], 1)
+    
+    def test_copy_and_pickle_keep_singleton(self):
+        """Test that copying or unpickling cannot alter the shared instance."""
+        name_before = self.monster.name
+        hash_before = hash(self.monster)
+        for clone in (copy.copy(self.monster), copy.deepcopy(self.monster),
+                      pickle.loads(pickle.dumps(self.monster))):
+            self.assertIs(clone, self.monster)
+        self.assertEqual(self.monster.name, name_before)
+        self.assertEqual(hash(self.monster), hash_before)
+        self.assertIs(MonsterElement("g").group, self.monster)
+        with self.assertRaises(TypeError):
+            MonsterGroup(name="Baby Monster")
+    
     def test_group_order(self):
         """Test the Monster group order."""
         expected_order = 808017424794512875886459904961710757005754368000000000
         self.assertEqual(self.monster.order, expected_order)
     
+    def test_order_display_constants(self):
+        """Test that the precomputed display strings match the order."""
+        self.assertEqual(MonsterGroup.ORDER_STR, str(MonsterGroup.ORDER))
+        self.assertEqual(MonsterGroup.ORDER_COMMAS, f"{MonsterGroup.ORDER:,}")
+    
     def test_order_verification(self):
         """Test that the order matches the prime factorization."""
         self.assertTrue(self.monster.verify_order())
     
+    def test_balanced_prod(self):
+        """Test the balanced product helper against a plain product."""
+        from monster_group import _balanced_prod
+        self.assertEqual(_balanced_prod([]), 1)
+        self.assertEqual(_balanced_prod([7]), 7)
+        values = [p ** e for p, e in self.monster.get_factorization().items()]
+        self.assertEqual(_balanced_prod(values), MonsterGroup.ORDER)
+    
     def test_prime_factorization(self):
         """Test the prime factorization."""
         factorization = self.monster.get_factorization()
@@ -86,6 +125,27 @@ class TestMonsterElement(unittest.TestCase):
         self.assertIsNone(element.order())  # Would require computation
         self.assertIsNone(element.conjugacy_class())  # Would require computation
     
+    def test_element_ids(self):
+        """Test that string ids are interned and other ids are accepted."""
+        a = MonsterElement("".join(["g", "1"]))
+        b = MonsterElement("".join(["g", "1"]))
+        self.assertIs(a.element_id, b.element_id)
+        self.assertTrue(MonsterElement("".join(["e"])).is_identity)
+        self.assertEqual(str(MonsterElement(5)), "MonsterElement(5)")
+        self.assertFalse(MonsterElement(5).is_identity)
+    
+    def test_shared_group(self):
+        """Test that elements share a single group instance."""
+        a = MonsterElement("a")
+        b = MonsterElement("b")
+        self.assertIs(a.group, b.group)
+        self.assertEqual(a.group.order, MonsterGroup.ORDER)
+    
+    def test_no_instance_dict(self):
+        """Test that elements use slots rather than a per-instance dict."""
+        element = MonsterElement("g")
+        self.assertFalse(hasattr(element, "__dict__"))
+    
     def test_string_representations(self):
         """Test string representations of elements."""
         element = MonsterElement("test")
@@ -94,6 +154,46 @@ class TestMonsterElement(unittest.TestCase):
         self.assertIn("MonsterElement", repr(element))
 
 
+class TestMonsterUtils(unittest.TestCase):
+    """Test cases for monster_utils helpers."""
+    
+    def test_format_large_number(self):
+        """Test comma and scientific formatting."""
+        formatted = format_large_number(MonsterGroup.ORDER)
+        self.assertTrue(formatted.startswith("808,017,424,"))
+        self.assertIn("8.08 × 10^53", formatted)
+    
+    def test_format_large_number_exponent(self):
+        """Test the exponent at powers-of-ten boundaries."""
+        for k in range(1, 60):
+            self.assertIn(f"× 10^{k - 1})", format_large_number(10 ** k - 1))
+            self.assertIn(f"× 10^{k})", format_large_number(10 ** k))
+        self.assertIn("(≈ 0)", format_large_number(0))
+    
+    def test_compare_group_orders(self):
+        """Test the group order comparison table."""
+        comparisons = compare_group_orders()
+        self.assertEqual(len(comparisons), 7)
+        self.assertEqual(comparisons[-1], ("Monster M", MonsterGroup.ORDER, "Same as Monster"))
+        # Callers get their own list
+        comparisons.clear()
+        self.assertEqual(len(compare_group_orders()), 7)
+    
+    def test_approx_ratio(self):
+        """Test the bit-length based ratio against exact division."""
+        from monster_utils import _approx_ratio
+        for order in (120, 244823040, 4157776806543360000, 4154781481226426191177580544000000):
+            self.assertAlmostEqual(_approx_ratio(MonsterGroup.ORDER, order) / (MonsterGroup.ORDER / order), 1.0, places=12)
+        self.assertAlmostEqual(_approx_ratio(3, 4), 0.75)
+    
+    def test_moonshine_info(self):
+        """Test the moonshine information mapping."""
+        moonshine = get_moonshine_info()
+        self.assertIn("196884", moonshine["significance"])
+        with self.assertRaises(TypeError):
+            moonshine["description"] = "changed"
+
+
 class TestDemonstration(unittest.TestCase):
     """Test the demonstration function."""
     